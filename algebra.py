@@ -1,5 +1,13 @@
-import math
-from typing import List, Tuple, Callable
+from operator import add as _add, sub as _sub
+from typing import List, Optional, Tuple, Callable, Union
+
+import numpy as np
+
+try:
+    from scipy.linalg.blas import dnrm2 as _nrm2
+except ImportError:
+    # SciPy is optional; without it the norm is computed by NumPy instead of calling BLAS directly
+    _nrm2 = np.linalg.norm
 
 Vector = List[float]
 Matrix = List[List[float]]
@@ -18,7 +26,7 @@ def add(v: Vector, w: Vector) -> Vector:
     """
     assert len(v) == len(w), 'both vectors must have the same length'
 
-    return [v_item + w_item for v_item, w_item in zip(v, w)]
+    return list(map(_add, v, w))
 
 
 def subtract(v: Vector, w: Vector) -> Vector:
@@ -34,26 +42,33 @@ def subtract(v: Vector, w: Vector) -> Vector:
     """
     assert len(v) == len(w), 'both vectors must have the same length'
 
-    return [v_item - w_item for v_item, w_item in zip(v, w)]
+    return list(map(_sub, v, w))
 
 
-def vector_sum(vectors: List[Vector]) -> Vector:
+def vector_sum(vectors: List[Vector], out: Optional[np.ndarray] = None) -> Union[Vector, np.ndarray]:
     """Adds a list of vectors componentwise. In other words, for each nth element of each vector,
     add those together to be the nth element of a result vector.
 
     Arguments:
         vectors {List[Vector]} -- a list of vectors of the same length
 
+    Keyword Arguments:
+        out {Optional[np.ndarray]} -- a preallocated float64 array to hold the result, useful when
+        summing repeatedly in a loop (default: {None})
+
     Returns:
-        Vector -- a vector whose elements are the sum of the input vectors' elements
+        Union[Vector, np.ndarray] -- a vector whose elements are the sum of the input vectors' elements,
+        or the {out} array itself when one is given
     """
     assert vectors, 'no vectors provided'
 
-    num_elements = len(vectors[0])
-    assert all(
-        len(v) == num_elements for v in vectors), 'vectors must be the same length'
+    # np.asarray raises a ValueError on ragged input, so no explicit length check is needed
+    stacked_vectors = np.asarray(vectors, dtype=np.float64)
 
-    return [sum(vec[i] for vec in vectors) for i in range(num_elements)]
+    if out is not None:
+        return np.add.reduce(stacked_vectors, axis=0, out=out)
+
+    return np.add.reduce(stacked_vectors, axis=0).tolist()
 
 
 def scalar_multiply(s: float, v: Vector) -> Vector:
@@ -66,7 +81,22 @@ def scalar_multiply(s: float, v: Vector) -> Vector:
     Returns:
         Vector -- the vector containing the product of the scalar multiplication
     """
-    return [s * v_item for v_item in v]
+    return (np.asarray(v, dtype=np.float64) * s).tolist()
+
+
+def scalar_multiply_into(s: float, v: Vector, out: np.ndarray) -> np.ndarray:
+    """Same as scalar_multiply, but writes the product into a preallocated buffer {out} instead of
+    allocating a new vector. {v} and {out} may be the same array, for an inplace multiplication
+
+    Arguments:
+        s {float} -- float to mutiply a vector's elements by
+        v {Vector} -- vector of any length
+        out {np.ndarray} -- a float64 array of the same length as {v} to hold the result
+
+    Returns:
+        np.ndarray -- the {out} buffer, now containing the product of the scalar multiplication
+    """
+    return np.multiply(v, s, out=out)
 
 
 def vector_mean(vectors: List[Vector]) -> Vector:
@@ -78,9 +108,11 @@ def vector_mean(vectors: List[Vector]) -> Vector:
     Returns:
         Vector -- [description]
     """
-    n = len(vectors)
+    assert vectors, 'no vectors provided'
 
-    return scalar_multiply(1/n, vector_sum(vectors))
+    # A single reduction over the stacked vectors, instead of a vector_sum pass followed by a
+    # scalar_multiply pass that each allocate their own list
+    return np.mean(np.asarray(vectors, dtype=np.float64), axis=0).tolist()
 
 
 def dot(v: Vector, w: Vector) -> float:
@@ -95,7 +127,7 @@ def dot(v: Vector, w: Vector) -> float:
     """
     assert len(v) == len(w), 'vectors must be the same length'
 
-    return sum(v_item * w_item for v_item, w_item in zip(v, w))
+    return float(np.dot(np.asarray(v, dtype=np.float64), np.asarray(w, dtype=np.float64)))
 
 
 def sum_of_squares(v: Vector) -> float:
@@ -107,7 +139,9 @@ def sum_of_squares(v: Vector) -> float:
     Returns:
         float -- the sum of the square of every element of vector {v}
     """
-    return dot(v, v)
+    v_arr = np.asarray(v, dtype=np.float64)
+
+    return dot(v_arr, v_arr)
 
 
 def magnitude(v: Vector) -> float:
@@ -119,7 +153,13 @@ def magnitude(v: Vector) -> float:
     Returns:
         float -- the magnitude of vector {v}
     """
-    return math.sqrt(sum_of_squares(v))
+    v_arr = np.ascontiguousarray(v, dtype=np.float64)
+
+    # BLAS nrm2 rejects empty vectors, whose magnitude is trivially 0
+    if not v_arr.size:
+        return 0.0
+
+    return float(_nrm2(v_arr))
 
 
 def distance(v: Vector, w: Vector) -> float:
@@ -132,7 +172,10 @@ def distance(v: Vector, w: Vector) -> float:
     Returns:
         float -- the distance between vectors {v} and {w}
     """
-    return magnitude(subtract(v, w))
+    assert len(v) == len(w), 'both vectors must have the same length'
+
+    # Subtract and take the norm in a single NumPy expression, without an intermediate Python list
+    return float(np.linalg.norm(np.asarray(v, dtype=np.float64) - np.asarray(w, dtype=np.float64)))
 
 
 def shape(A: Matrix) -> Tuple[int, int]:
@@ -176,7 +219,99 @@ def get_column(A: Matrix, j: int) -> Vector:
     return [A_i[j] for A_i in A]
 
 
-def make_matrix(num_rows: int, num_cols: int, entry_fn: Callable[[int, int], float]) -> Matrix:
+def transpose(A: Matrix) -> Matrix:
+    """Returns the transpose of a matrix, so that its columns can be read as rows. Callers that need
+    many columns of the same matrix should transpose it once instead of calling get_column repeatedly.
+    Numeric matrices go through NumPy, so one that mixes ints and floats comes back with all of its
+    entries as floats. Any other matrix is handed to transpose_blocked, which keeps the original objects
+
+    Arguments:
+        A {Matrix} -- a matrix of any length
+
+    Returns:
+        Matrix -- the transpose of matrix {A}, with shape (n_cols, n_rows)
+    """
+    try:
+        A_arr = np.asarray(A)
+    except ValueError:
+        A_arr = None
+
+    # Only numeric matrices go through NumPy. Anything else (e.g. mixed numbers and strings, which
+    # np.asarray would turn into all strings) keeps its original objects via the pure Python version
+    if A_arr is None or A_arr.ndim != 2 or A_arr.dtype.kind not in 'biufc':
+        return transpose_blocked(A)
+
+    return A_arr.T.tolist()
+
+
+def transpose_blocked(A: Matrix, block_size: int = 32) -> Matrix:
+    """Pure Python version of transpose that walks the matrix in square tiles of {block_size}, so that
+    reads and writes stay within a small set of rows at a time instead of striding through all of them
+
+    Arguments:
+        A {Matrix} -- a matrix of any length
+
+    Keyword Arguments:
+        block_size {int} -- the side of the square tiles to copy at a time (default: {32})
+
+    Returns:
+        Matrix -- the transpose of matrix {A}, with shape (n_cols, n_rows)
+    """
+    num_rows, num_cols = shape(A)
+    assert all(len(A_i) == num_cols for A_i in A), 'all rows of the matrix must have the same length'
+
+    B: Matrix = [[0] * num_rows for _ in range(num_cols)]
+
+    for ii in range(0, num_rows, block_size):
+        for jj in range(0, num_cols, block_size):
+            for i in range(ii, min(ii + block_size, num_rows)):
+                A_i = A[i]
+                for j in range(jj, min(jj + block_size, num_cols)):
+                    B[j][i] = A_i[j]
+
+    return B
+
+
+def matvec(A: Matrix, x: Vector) -> Vector:
+    """Multiplies a matrix by a vector. Equivalent to taking the dot product of {x} with every row of
+    {A}, but done in a single matrix-vector product instead of a Python loop over get_row and dot
+
+    Arguments:
+        A {Matrix} -- a matrix of shape (n_rows, n_cols)
+        x {Vector} -- a vector of length n_cols
+
+    Returns:
+        Vector -- a vector of length n_rows with the product of {A} and {x}
+    """
+    assert shape(A)[1] == len(x), 'vector length must match the number of matrix columns'
+
+    # Reshaping keeps an empty matrix 2-D, so the product is an empty vector rather than a scalar
+    A_arr = np.asarray(A, dtype=np.float64).reshape(shape(A))
+
+    return (A_arr @ np.asarray(x, dtype=np.float64)).tolist()
+
+
+def row_dots(A: Matrix, B: Matrix) -> Vector:
+    """Computes the dot product of every row of {A} with the matching row of {B}
+
+    Arguments:
+        A {Matrix} -- a matrix of any shape
+        B {Matrix} -- a matrix of the same shape as {A}
+
+    Returns:
+        Vector -- a vector whose i-th element is the dot product of the i-th rows of {A} and {B}
+    """
+    assert shape(A) == shape(B), 'matrices must have the same shape'
+
+    # Reshaping keeps an empty matrix 2-D, which np.einsum needs for its 'ij' subscripts
+    A_arr = np.asarray(A, dtype=np.float64).reshape(shape(A))
+    B_arr = np.asarray(B, dtype=np.float64).reshape(shape(B))
+
+    return np.einsum('ij,ij->i', A_arr, B_arr).tolist()
+
+
+def make_matrix(num_rows: int, num_cols: int, entry_fn: Callable[[int, int], float],
+                vectorized: bool = False) -> Matrix:
     """Creates a matrix of shape {num_rows} x {num_cols} whose (i, j)-entry is {entry_fn}(i, j)
 
     Arguments:
@@ -184,14 +319,58 @@ def make_matrix(num_rows: int, num_cols: int, entry_fn: Callable[[int, int], flo
         num_cols {int} -- number of columns for the resulting matrix
         entry_fn {Callable[[int, int], float]} -- a function to define the values of the matrix
 
+    Keyword Arguments:
+        vectorized {bool} -- whether {entry_fn} works elementwise on NumPy arrays (e.g. lambda i, j: i + j),
+        so it can be called once with the full index grids instead of once per entry. The grids are int64
+        arrays, so unlike Python ints the entries can silently wrap around on overflow (default: {False})
+
     Returns:
         Matrix -- a {num_rows} x {num_cols} with {entry_fn}(i, j) elements for each (i, j)
     """
+    if vectorized:
+        try:
+            entries = np.fromfunction(entry_fn, (num_rows, num_cols), dtype=np.int64)
+        except (TypeError, ValueError, OverflowError):
+            entries = None
+
+        # Anything but a full grid of values (e.g. a scalar from a function that ignores its
+        # arguments) is not a vectorized result, so the matrix is built one entry at a time instead
+        if isinstance(entries, np.ndarray) and entries.shape == (num_rows, num_cols):
+            return entries.tolist()
+
     return [[entry_fn(i, j)
              for j in range(num_cols)]
             for i in range(num_rows)]
 
 
+def make_matrix_np(num_rows: int, num_cols: int, entry_fn: Callable[[int, int], float]) -> Matrix:
+    """Same as make_matrix, but first tries to call {entry_fn} once with the full row and column index
+    grids from np.fromfunction, which works when it is array-compatible (e.g. lambda i, j: i + j). In
+    that case the entries are computed in float64 arithmetic and returned as floats. When {entry_fn}
+    does not return a full float64-compatible grid, or the arithmetic overflows or divides by zero, it
+    falls back to make_matrix, which calls {entry_fn} once for every (i, j) and keeps its exact values
+
+    Arguments:
+        num_rows {int} -- number of rows for the resulting matrix
+        num_cols {int} -- number of columns for the resulting matrix
+        entry_fn {Callable[[int, int], float]} -- a function to define the values of the matrix
+
+    Returns:
+        Matrix -- a {num_rows} x {num_cols} with {entry_fn}(i, j) elements for each (i, j)
+    """
+    try:
+        with np.errstate(all='raise'):
+            entries = np.fromfunction(entry_fn, (num_rows, num_cols), dtype=np.float64)
+    except (TypeError, ValueError, OverflowError, FloatingPointError):
+        entries = None
+
+    if (isinstance(entries, np.ndarray) and entries.shape == (num_rows, num_cols)
+            and entries.dtype.kind in 'biuf'):
+        return entries.astype(np.float64).tolist()
+
+    return make_matrix(num_rows, num_cols, entry_fn)
+
+
 def identity_matrix(n: int) -> Matrix:
     """Constructs and returns a {n} x {n} identity matrix (a matrix with 1s on the diagonals and 0s elsewhere)
 
@@ -201,7 +380,7 @@ def identity_matrix(n: int) -> Matrix:
     Returns:
         Matrix -- a {n} x {n} identity matrix
     """
-    return make_matrix(n, n, lambda i, j: 1 if i == j else 0)
+    return np.eye(n, dtype=np.float64).tolist()
 
 
 if __name__ == '__main__':
@@ -209,17 +388,67 @@ if __name__ == '__main__':
     assert add([1, 2, 3], [4, 5, 6]) == [5, 7, 9]
     assert subtract([5, 7, 9], [4, 5, 6]) == [1, 2, 3]
     assert vector_sum([[1, 2], [3, 4], [5, 6], [7, 8]]) == [16, 20]
+    assert vector_sum([[1, 2], [3, 4], [5, 6], [7, 8]], out=np.empty(2)).tolist() == [16, 20]
     assert scalar_multiply(2, [1, 2, 3]) == [2, 4, 6]
+    assert scalar_multiply_into(2, [1, 2, 3], np.empty(3)).tolist() == [2, 4, 6]
     assert vector_mean([[1, 2], [3, 4], [5, 6]]) == [3, 4]
     assert dot([1, 2, 3], [4, 5, 6]) == 32
     assert sum_of_squares([1, 2, 3]) == 14
     assert magnitude([3, 4]) == 5
+    assert magnitude([]) == 0
     assert distance([2, 3, 4, 2], [1, -2, 1, 3]) == 6
 
     # Matrices
     assert shape([[1, 2, 3], [4, 5, 6]]) == (2, 3)
     assert get_row([[1, 2, 3], [4, 5, 6]], 0) == [1, 2, 3]
     assert get_column([[1, 2, 3], [4, 5, 6]], 0) == [1, 4]
+    assert transpose([[1, 2, 3], [4, 5, 6]]) == [[1, 4], [2, 5], [3, 6]]
+    assert transpose([[1, 'a']]) == transpose_blocked([[1, 'a']]) == [[1], ['a']]
+    assert transpose([]) == []
+    assert transpose([[1, 2.5]]) == [[1.0], [2.5]]
+    for ragged_matrix in ([[1, 2], [3, 4, 5]], [[1, 2, 3], [4]]):
+        try:
+            transpose(ragged_matrix)
+            assert False, 'ragged matrices should be rejected'
+        except AssertionError as error:
+            assert 'same length' in str(error)
+    assert transpose_blocked([[1, 2, 3], [4, 5, 6]], block_size=2) == [[1, 4], [2, 5], [3, 6]]
+    assert matvec([[1, 2, 3], [4, 5, 6]], [1, 0, -1]) == [-2, -2]
+    assert row_dots([[1, 2, 3], [4, 5, 6]], [[1, 1, 1], [2, 0, 1]]) == [6, 14]
+    assert matvec([], []) == []
+    assert row_dots([], []) == []
+    assert make_matrix(2, 3, lambda i, j: i + j) == [[0, 1, 2], [1, 2, 3]]
+    assert make_matrix(2, 2, lambda i, j: 7) == [[7, 7], [7, 7]]
+    assert make_matrix(2, 2, lambda i, j: 1 if i == j else 0) == [[1, 0], [0, 1]]
+    assert make_matrix(2, 2, lambda i, j: [[1, 2], [3, 4]][i][j]) == [[1, 2], [3, 4]]
+    assert make_matrix(1, 65, lambda i, j: 2 ** j)[0][64] == 2 ** 64
+    assert make_matrix(1, 2, lambda i, j: i * 10 ** 20) == [[0, 0]]
+    assert make_matrix(1, 2, lambda i, j: f'{i}{j}') == [['00', '01']]
+    entry_calls = []
+    assert make_matrix(2, 3, lambda i, j: entry_calls.append((i, j)) or len(entry_calls)) == [[1, 2, 3], [4, 5, 6]]
+    assert len(entry_calls) == 6
+    try:
+        make_matrix(2, 2, lambda i, j: 1 / (i - j))
+        assert False, 'division by zero should raise'
+    except ZeroDivisionError:
+        pass
+    assert make_matrix(2, 3, lambda i, j: i + j, vectorized=True) == [[0, 1, 2], [1, 2, 3]]
+    assert make_matrix(2, 2, lambda i, j: 1 if i == j else 0, vectorized=True) == [[1, 0], [0, 1]]
+    entry_calls = []
+    assert make_matrix(2, 2, lambda i, j: entry_calls.append((i, j)) or 7, vectorized=True) == [[7, 7], [7, 7]]
+    assert len(entry_calls) == 5
+    assert make_matrix(1, 2, lambda i, j: i * 10 ** 20, vectorized=True) == [[0, 0]]
+    assert make_matrix_np(2, 3, lambda i, j: i + j) == [[0, 1, 2], [1, 2, 3]]
+    assert make_matrix_np(0, 3, lambda i, j: i + j) == []
+    assert make_matrix_np(2, 2, lambda i, j: 0 if i == 0 else 0.5) == [[0, 0], [0.5, 0.5]]
+    assert make_matrix_np(1, 2, lambda i, j: None) == [[None, None]]
+    assert make_matrix_np(1, 2, lambda i, j: 10 ** 400) == [[10 ** 400, 10 ** 400]]
+    assert make_matrix_np(1, 65, lambda i, j: 2 ** j)[0][64] == 2.0 ** 64
+    try:
+        make_matrix_np(2, 2, lambda i, j: 1 / (i - j))
+        assert False, 'division by zero should raise'
+    except ZeroDivisionError:
+        pass
     assert identity_matrix(5) == [[1, 0, 0, 0, 0],
                                   [0, 1, 0, 0, 0],
                                   [0, 0, 1, 0, 0],
@@ -0,0 +1,91 @@
+# cython: language_level=3
+"""Compiled versions of the core vector loops from algebra.py, for when NumPy or Numba are too heavy a
+dependency. Inputs are any contiguous buffer of doubles, such as array.array('d', ...) or a float64
+NumPy array. Build with `python setup.py build_ext --inplace`.
+"""
+cimport cython
+from cpython cimport array
+
+import array
+
+cdef array.array _double_template = array.array('d')
+
+
+cdef inline void _check_lengths(double[::1] v, double[::1] w) except *:
+    if v.shape[0] != w.shape[0]:
+        raise ValueError('both vectors must have the same length')
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+cpdef double cdot(double[::1] v, double[::1] w) except? -1.0:
+    """Computes the sum of the componentwise products of two vectors. Returns the dot product.
+
+    Arguments:
+        v {double[::1]} -- a contiguous buffer of doubles of length n
+        w {double[::1]} -- another contiguous buffer of doubles of the same length n
+
+    Returns:
+        float -- the dot product of the input vectors
+    """
+    _check_lengths(v, w)
+
+    cdef double s = 0.0
+    cdef Py_ssize_t i
+
+    with nogil:
+        for i in range(v.shape[0]):
+            s += v[i] * w[i]
+
+    return s
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef array.array cadd(double[::1] v, double[::1] w):
+    """Adds two vectors together using the principles of vector addition.
+
+    Arguments:
+        v {double[::1]} -- a contiguous buffer of doubles of length n
+        w {double[::1]} -- another contiguous buffer of doubles of the same length n
+
+    Returns:
+        array.array -- sum of the input vectors, as an array of doubles
+    """
+    _check_lengths(v, w)
+
+    cdef Py_ssize_t i, n = v.shape[0]
+    cdef array.array result = array.clone(_double_template, n, zero=False)
+    cdef double[::1] out = result
+
+    with nogil:
+        for i in range(n):
+            out[i] = v[i] + w[i]
+
+    return result
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef array.array csub(double[::1] v, double[::1] w):
+    """Subtracts two vectors together using the principles of vector subtraction.
+
+    Arguments:
+        v {double[::1]} -- a contiguous buffer of doubles of length n
+        w {double[::1]} -- another contiguous buffer of doubles of the same length n
+
+    Returns:
+        array.array -- result of the subtraction of the input vectors, as an array of doubles
+    """
+    _check_lengths(v, w)
+
+    cdef Py_ssize_t i, n = v.shape[0]
+    cdef array.array result = array.clone(_double_template, n, zero=False)
+    cdef double[::1] out = result
+
+    with nogil:
+        for i in range(n):
+            out[i] = v[i] - w[i]
+
+    return result
@@ -0,0 +1,212 @@
+from typing import List, Union
+
+import numpy as np
+from numba import njit, prange
+
+Array = np.ndarray
+ArrayLike = Union[List[float], np.ndarray]
+
+
+@njit(cache=True, fastmath=True)
+def _add(v: Array, w: Array) -> Array:
+    """Compiled loop behind add. Adds {v} and {w} elementwise into a new array
+
+    Arguments:
+        v {Array} -- a contiguous float64 array of length n
+        w {Array} -- another contiguous float64 array of the same length n
+
+    Returns:
+        Array -- sum of the input vectors
+    """
+    out = np.empty(v.shape[0])
+    for i in range(v.shape[0]):
+        out[i] = v[i] + w[i]
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def _subtract(v: Array, w: Array) -> Array:
+    """Compiled loop behind subtract. Subtracts {w} from {v} elementwise into a new array
+
+    Arguments:
+        v {Array} -- a contiguous float64 array of length n
+        w {Array} -- another contiguous float64 array of the same length n
+
+    Returns:
+        Array -- result of the subtraction of the input vectors
+    """
+    out = np.empty(v.shape[0])
+    for i in range(v.shape[0]):
+        out[i] = v[i] - w[i]
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def _dot(v: Array, w: Array) -> float:
+    """Compiled loop behind dot. Accumulates the componentwise products of {v} and {w}
+
+    Arguments:
+        v {Array} -- a contiguous float64 array of length n
+        w {Array} -- another contiguous float64 array of the same length n
+
+    Returns:
+        float -- the dot product of the input vectors
+    """
+    s = 0.0
+    for i in range(v.shape[0]):
+        s += v[i] * w[i]
+    return s
+
+
+@njit(cache=True, fastmath=True)
+def _scalar_multiply(s: float, v: Array) -> Array:
+    """Compiled loop behind scalar_multiply. Multiplies every element of {v} by {s} into a new array
+
+    Arguments:
+        s {float} -- float to mutiply a vector's elements by
+        v {Array} -- a contiguous float64 array of any length
+
+    Returns:
+        Array -- the vector containing the product of the scalar multiplication
+    """
+    out = np.empty(v.shape[0])
+    for i in range(v.shape[0]):
+        out[i] = s * v[i]
+    return out
+
+
+_VECTOR_SUM_BLOCK = 1024
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _vector_sum(vectors: Array) -> Array:
+    """Compiled, multithreaded loop behind vector_sum. Sums the rows of {vectors} in blocks of
+    _VECTOR_SUM_BLOCK columns, one block per thread
+
+    Arguments:
+        vectors {Array} -- a contiguous 2-D float64 array with one vector per row
+
+    Returns:
+        Array -- a vector whose elements are the sum of the rows of {vectors}
+    """
+    num_vectors, num_elements = vectors.shape
+    num_blocks = (num_elements + _VECTOR_SUM_BLOCK - 1) // _VECTOR_SUM_BLOCK
+    out = np.zeros(num_elements)
+    # Each thread owns a block of output columns and walks the rows in order, so the inner loop reads
+    # a contiguous slice of every row instead of striding down the columns of the row-major array
+    for b in prange(num_blocks):
+        start = b * _VECTOR_SUM_BLOCK
+        stop = min(start + _VECTOR_SUM_BLOCK, num_elements)
+        out_block = out[start:stop]
+        for i in range(num_vectors):
+            row_block = vectors[i, start:stop]
+            for j in range(stop - start):
+                out_block[j] += row_block[j]
+    return out
+
+
+def _as_array(v: ArrayLike) -> Array:
+    """Converts {v} to a contiguous float64 array. Arrays that already have that layout are returned
+    as-is, so callers can convert once and reuse the result across several calls.
+
+    Arguments:
+        v {ArrayLike} -- a list of floats or a NumPy array
+
+    Returns:
+        Array -- a contiguous float64 array with the values of {v}
+    """
+    return np.ascontiguousarray(v, dtype=np.float64)
+
+
+def add(v: ArrayLike, w: ArrayLike) -> Array:
+    """JIT-compiled version of algebra.add. Adds two vectors together using the principles of
+    vector addition.
+
+    Arguments:
+        v {ArrayLike} -- a vector of floats of length n
+        w {ArrayLike} -- another vector of floats of the same length n
+
+    Returns:
+        Array -- sum of the input vectors
+    """
+    assert len(v) == len(w), 'both vectors must have the same length'
+
+    return _add(_as_array(v), _as_array(w))
+
+
+def subtract(v: ArrayLike, w: ArrayLike) -> Array:
+    """JIT-compiled version of algebra.subtract. Subtracts two vectors together using the principles
+    of vector subtraction.
+
+    Arguments:
+        v {ArrayLike} -- a vector of floats of length n
+        w {ArrayLike} -- another vector of floats of the same length n
+
+    Returns:
+        Array -- result of the subtraction of the input vectors
+    """
+    assert len(v) == len(w), 'both vectors must have the same length'
+
+    return _subtract(_as_array(v), _as_array(w))
+
+
+def dot(v: ArrayLike, w: ArrayLike) -> float:
+    """JIT-compiled version of algebra.dot. Computes the sum of the componentwise products of two
+    vectors.
+
+    Arguments:
+        v {ArrayLike} -- a vector of floats of length n
+        w {ArrayLike} -- another vector of floats of the same length n
+
+    Returns:
+        float -- the dot product of the input vectors
+    """
+    assert len(v) == len(w), 'vectors must be the same length'
+
+    return _dot(_as_array(v), _as_array(w))
+
+
+def scalar_multiply(s: float, v: ArrayLike) -> Array:
+    """JIT-compiled version of algebra.scalar_multiply. Multiplies every element of vector {v} by a
+    scalar {s}.
+
+    Arguments:
+        s {float} -- float to mutiply a vector's elements by
+        v {ArrayLike} -- vector of any length
+
+    Returns:
+        Array -- the vector containing the product of the scalar multiplication
+    """
+    return _scalar_multiply(float(s), _as_array(v))
+
+
+def vector_sum(vectors: Union[List[ArrayLike], Array]) -> Array:
+    """JIT-compiled, multithreaded version of algebra.vector_sum. Adds a list of vectors
+    componentwise.
+
+    Arguments:
+        vectors {Union[List[ArrayLike], Array]} -- a list of vectors of the same length, or a 2-D array
+
+    Returns:
+        Array -- a vector whose elements are the sum of the input vectors' elements
+    """
+    assert len(vectors), 'no vectors provided'
+
+    vectors_arr = _as_array(vectors)
+    assert vectors_arr.ndim == 2, 'vectors must be a list of vectors or a 2-D array'
+
+    return _vector_sum(vectors_arr)
+
+
+if __name__ == '__main__':
+    assert add([1, 2, 3], [4, 5, 6]).tolist() == [5, 7, 9]
+    assert subtract([5, 7, 9], [4, 5, 6]).tolist() == [1, 2, 3]
+    assert vector_sum([[1, 2], [3, 4], [5, 6], [7, 8]]).tolist() == [16, 20]
+    assert np.allclose(vector_sum(np.ones((3, 2500))), 3)
+    try:
+        vector_sum([1, 2, 3])
+        assert False, '1-D input should be rejected'
+    except AssertionError as error:
+        assert '2-D' in str(error)
+    assert scalar_multiply(2, [1, 2, 3]).tolist() == [2, 4, 6]
+    assert dot([1, 2, 3], [4, 5, 6]) == 32
@@ -1,6 +1,8 @@
 from __future__ import annotations
 from typing import List, Optional
 
+import numpy as np
+
 Array = List[float]
 
 
@@ -29,8 +31,34 @@ class Vector(NTuple):
         Arguments:
             items {Array} -- the initial values that compose a particular vector (default: {[]})
         """
-        self.items = items
-        self.length = len(items)
+        # Items are stored as a contiguous float64 array, so vector arithmetic runs as NumPy expressions.
+        # np.array copies its input, so mutating the Vector inplace never touches the caller's data
+        self.items = np.array(items, dtype=np.float64, order='C')
+
+    @classmethod
+    def _from_array(cls, items: np.ndarray) -> Vector:
+        """Internal constructor that wraps an already contiguous float64 array without copying or
+        converting it. Used to return the freshly allocated results of Vector operations
+
+        Arguments:
+            items {np.ndarray} -- a contiguous float64 array that is not referenced anywhere else
+
+        Returns:
+            Vector -- a Vector whose items are {items}
+        """
+        vector = cls.__new__(cls)
+        vector.items = items
+
+        return vector
+
+    @property
+    def length(self) -> int:
+        """Length of the vector, read from the shape of its items
+
+        Returns:
+            int -- number of elements (length) of the vector
+        """
+        return self.items.shape[0]
 
     def __repr__(self) -> str:
         """Defines a formal string representation for a Vector
@@ -38,16 +66,16 @@ class Vector(NTuple):
         Returns:
             str -- a formal representation of the Vector object
         """
-        return f'Vector({self.items})'
+        return f'Vector({self.items.tolist()})'
 
     def __str__(self) -> str:
         """Produces a beautyfied string representation of a Vector for visualization purposes. This is cheating but
-        it works, since we are using to our advantage the fact that the Vector's items are just a list of floats.
+        it works, since we are using to our advantage the fact that the Vector's items convert to a list of floats.
 
         Returns:
             str -- a beautyfied representation of the Vector object
         """
-        return str(self.items)
+        return str(self.items.tolist())
 
     def __len__(self) -> int:
         """Computates and returns the length of the vector
@@ -55,7 +83,7 @@ class Vector(NTuple):
         Returns:
             int -- number of elements (length) of the vector
         """
-        return self.length
+        return self.items.shape[0]
 
     def add(self, other: Vector, inplace: bool = False) -> Optional[Vector]:
         """Adds two vectors of the same length together using the principles of vector addition.
@@ -72,14 +100,11 @@ class Vector(NTuple):
         assert isinstance(other, Vector), 'item to be added must be a Vector'
         assert len(self) == len(other), 'vectors should be the same length'
 
-        sum_of_elements = [self_item + other_item for self_item, other_item in
-                           zip(self.items, other.items)]
-
         if inplace:
-            self.items = sum_of_elements
+            self.items += other.items
             return None
 
-        return Vector(sum_of_elements)
+        return Vector._from_array(self.items + other.items)
 
     def __add__(self, other: Vector) -> Optional[Vector]:
         """Defines how a Vector object behaves with the '+' operator. Utilizes the Vector add()
@@ -110,14 +135,11 @@ class Vector(NTuple):
             other, Vector), 'item to be subtracted must be a Vector'
         assert len(self) == len(other), 'vectors should be the same length'
 
-        sub_of_elements = [self_item - other_item for self_item, other_item in
-                           zip(self.items, other.items)]
-
         if inplace:
-            self.items = sub_of_elements
+            self.items -= other.items
             return None
 
-        return Vector(sub_of_elements)
+        return Vector._from_array(self.items - other.items)
 
     def __sub__(self, other: Vector) -> Optional[Vector]:
         """Defines how a Vector object behaves with the '-' operator. Utilizes the Vector subtract()
@@ -144,21 +166,53 @@ class Vector(NTuple):
             Optional[Vector] -- either a vector if {inplace == False} or None
         """
         assert vectors, 'no vectors provided'
+        assert all(
+            len(v) == len(self) for v in vectors), 'vectors must be the same length'
 
-        vectors.append(self)
+        # Copy every vector, {self} last, into one contiguous block and reduce it in a single pass.
+        # This leaves the caller's {vectors} list untouched
+        stacked_items = np.empty((len(vectors) + 1, len(self)))
+        stacked_items[:-1] = [vec.items for vec in vectors]
+        stacked_items[-1] = self.items
 
-        num_elements = len(vectors[0])
+        sum_of_all = stacked_items.sum(axis=0)
+
+        if inplace:
+            self.items = sum_of_all
+            return None
+
+        return Vector._from_array(sum_of_all)
+
+    def vector_mean(self, vectors: List[Vector], inplace: bool = False) -> Optional[Vector]:
+        """Calculates the elementwise mean of {self} and a list of Vectors. The sum is accumulated
+        into a single buffer and scaled at the end, without an intermediate vector_sum result.
+
+        Arguments:
+            vectors {List[Vector]} -- a list of Vectors of the same length as {self}
+
+        Keyword Arguments:
+            inplace {bool} -- whether or not to mutate {self} (default: {False})
+
+        Returns:
+            Optional[Vector] -- either a vector if {inplace == False} or None
+        """
+        assert vectors, 'no vectors provided'
         assert all(
-            len(v) == num_elements for v in vectors), 'vectors must be the same length'
+            len(v) == len(self) for v in vectors), 'vectors must be the same length'
 
-        sum_of_all = [sum(vec.items[i] for vec in vectors)
-                      for i in range(num_elements)]
+        # Always accumulate into a copy: {self} may also be in {vectors}, and adding into self.items
+        # directly would then read back the partially updated buffer
+        mean_of_all = self.items.copy()
+
+        for vec in vectors:
+            mean_of_all += vec.items
+        mean_of_all *= 1 / (len(vectors) + 1)
 
         if inplace:
-            self.items = sum_of_all
+            self.items = mean_of_all
             return None
 
-        return Vector(sum_of_all)
+        return Vector._from_array(mean_of_all)
 
 
 if __name__ == '__main__':
@@ -177,13 +231,31 @@ if __name__ == '__main__':
 
     # Check that {test_add} and {test_add_op} are Vectors with value [5, 7, 9]
     assert test_add is not None and isinstance(
-        test_add, Vector) and test_add.items == [5, 7, 9]
+        test_add, Vector) and test_add.items.tolist() == [5, 7, 9]
 
     assert test_add_op is not None and isinstance(
-        test_add_op, Vector) and test_add_op.items == [5, 7, 9]
+        test_add_op, Vector) and test_add_op.items.tolist() == [5, 7, 9]
 
     # Check that vector addition returns None when done inplace
     assert test_v.add(test_w, inplace=True) is None
 
     # Check that {test_v} is now mutated after vector addition. It should now be [5, 7, 9]
-    assert test_v.items == [5, 7, 9]
+    assert test_v.items.tolist() == [5, 7, 9]
+
+    # Check that vector_sum adds {test_v} to the list of vectors without mutating the list
+    test_vectors = [test_w, test_w]
+    test_sum = test_v.vector_sum(test_vectors)
+    assert test_sum is not None and test_sum.items.tolist() == [13, 17, 21]
+    assert len(test_vectors) == 2
+
+    # Check the elementwise mean of {test_v} and {test_w}, both as a new Vector and inplace
+    test_mean = test_v.vector_mean([test_w])
+    assert test_mean is not None and test_mean.items.tolist() == [4.5, 6, 7.5]
+    assert test_v.items.tolist() == [5, 7, 9]
+    assert test_v.vector_mean([test_w], inplace=True) is None
+    assert test_v.items.tolist() == [4.5, 6, 7.5]
+
+    # Check that an inplace mean is still correct when {self} is also among the vectors
+    test_u = Vector([1, 2])
+    assert test_u.vector_mean([Vector([3, 4]), test_u], inplace=True) is None
+    assert np.allclose(test_u.items, [5 / 3, 8 / 3])
@@ -0,0 +1,13 @@
+"""Builds the optional Cython extension in algebra_c.pyx. Run `python setup.py build_ext --inplace`."""
+from setuptools import Extension, setup
+from Cython.Build import cythonize
+
+extensions = [
+    Extension('algebra_c', ['algebra_c.pyx'],
+              extra_compile_args=['-O3', '-march=native', '-ffast-math'])
+]
+
+setup(
+    name='algebra_c',
+    ext_modules=cythonize(extensions, language_level=3),
+)
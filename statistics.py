@@ -1,6 +1,9 @@
-from typing import List
+import math
+from typing import Dict, List, Optional, Union
 from collections import Counter
 
+import numpy as np
+
 
 def mean(xs: List[float]) -> float:
     """Calculates the arithmetic mean of a list of values
@@ -11,7 +14,7 @@ def mean(xs: List[float]) -> float:
     Returns:
         float -- the mean of the values in {xs}
     """
-    return sum(xs) / len(xs)
+    return math.fsum(xs) / len(xs)
 
 
 def _median_odd(xs: List[float]) -> float:
@@ -23,7 +26,10 @@ def _median_odd(xs: List[float]) -> float:
     Returns:
         float -- the median (middle value) of vector {xs}
     """
-    return sorted(xs)[len(xs) // 2]
+    midpoint = len(xs) // 2
+
+    # Partitioning only places the k-th element, which is O(n) instead of a full O(n log n) sort
+    return float(np.partition(np.asarray(xs, dtype=np.float64), midpoint)[midpoint])
 
 
 def _median_even(xs: List[float]) -> float:
@@ -35,10 +41,10 @@ def _median_even(xs: List[float]) -> float:
     Returns:
         float -- the median (the mean of both middle values) of vector {xs}
     """
-    sorted_xs = sorted(xs)
     hi_midpoint = len(xs) // 2
+    partitioned_xs = np.partition(np.asarray(xs, dtype=np.float64), (hi_midpoint - 1, hi_midpoint))
 
-    return (sorted_xs[hi_midpoint - 1] + sorted_xs[hi_midpoint]) / 2
+    return float(partitioned_xs[hi_midpoint - 1] + partitioned_xs[hi_midpoint]) / 2
 
 
 def median(v: List[float]) -> float:
@@ -63,13 +69,82 @@ def quantile(xs: List[float], p: float) -> float:
     Returns:
         float -- the value at the {p}-th percentile of vector {xs}
     """
-    p_index = int(p * len(xs))
+    xs_arr = np.asarray(xs, dtype=np.float64)
+    p_index = int(p * xs_arr.size)
+
+    return float(np.partition(xs_arr, p_index)[p_index])
+
+
+def quantiles(xs: List[float], ps: List[float]) -> List[float]:
+    """Returns the values at several percentiles of a vector. The vector is sorted only once and each
+    percentile is then a constant time lookup, which is cheaper than calling quantile repeatedly
+
+    Arguments:
+        xs {List[float]} -- a vector of any length
+        ps {List[float]} -- a list of percentile values
+
+    Returns:
+        List[float] -- the values at each of the percentiles in {ps} of vector {xs}
+    """
+    sorted_xs = np.sort(np.asarray(xs, dtype=np.float64))
+
+    return [float(sorted_xs[int(p * sorted_xs.size)]) for p in ps]
+
+
+def sorted_stats(xs: List[float]) -> Dict[str, Union[float, np.ndarray]]:
+    """Sorts a vector once and returns it together with its median, so that further order statistics
+    can be read from the sorted array without sorting again
+
+    Arguments:
+        xs {List[float]} -- a vector of any length
+
+    Returns:
+        Dict[str, Union[float, np.ndarray]] -- the 'median' of {xs} and the 'sorted' array of its values
+    """
+    sorted_xs = np.sort(np.asarray(xs, dtype=np.float64))
+    n = sorted_xs.size
+    hi_midpoint = n // 2
+
+    if n % 2 == 0:
+        median_xs = float(sorted_xs[hi_midpoint - 1] + sorted_xs[hi_midpoint]) / 2
+    else:
+        median_xs = float(sorted_xs[hi_midpoint])
+
+    return {'median': median_xs, 'sorted': sorted_xs}
+
+
+def _small_int_array(x: List[float]) -> Optional[np.ndarray]:
+    """Converts {x} to an int64 array if it only holds small non-negative integers, which can then be
+    counted with np.bincount. The bound on the largest value keeps the count buffer from growing much
+    larger than the input itself. Anything else is rejected before building an array
+
+    Arguments:
+        x {List[float]} -- a vector of any length
+
+    Returns:
+        Optional[np.ndarray] -- {x} as a 1-D int64 array, or None if it does not qualify
+    """
+    if isinstance(x, np.ndarray):
+        x_arr = x
+    elif len(x) and type(x[0]) is int:
+        # Checking the first element keeps strings, floats and tuples from ever being converted. A
+        # list that only starts with an int converts to a non-integer dtype and is rejected below
+        try:
+            x_arr = np.array(x)
+        except (ValueError, OverflowError):
+            return None
+    else:
+        return None
 
-    return sorted(xs)[p_index]
+    if (x_arr.ndim != 1 or x_arr.dtype.kind not in 'iu' or not x_arr.size
+            or x_arr.min() < 0 or x_arr.max() > 2 * x_arr.size):
+        return None
+
+    return x_arr
 
 
 def mode(x: List[float]) -> List[float]:
-    """Returns a list of the most common values of a vector
+    """Returns a list of the most common values of a vector, in the order they first appear in it
 
     Arguments:
         x {List[float]} -- a vector of any length
@@ -77,13 +152,26 @@ def mode(x: List[float]) -> List[float]:
     Returns:
         List[float] -- a list containing the most common values (mode) of {x}
     """
+    x_arr = _small_int_array(x)
+
+    if x_arr is not None:
+        counts_arr = np.bincount(x_arr)
+        is_mode = counts_arr == counts_arr.max()
+
+        # Keep the first occurrence of each mode, so the result is in the same order as Counter's
+        mode_occurrences = x_arr[is_mode[x_arr]]
+        _, first_indices = np.unique(mode_occurrences, return_index=True)
+
+        return mode_occurrences[np.sort(first_indices)].tolist()
+
     counts = Counter(x)
-    max_count = max(counts.values())
+    max_count = counts.most_common(1)[0][1]
 
     return [x_i for x_i, count in counts.items() if count == max_count]
 
 
 if __name__ == '__main__':
+    assert mean([0.1] * 10) == 0.1
     assert median([1, 10, 2, 9, 5]) == 5
     assert median([1, 9, 2, 10]) == (2 + 9) / 2
 
@@ -93,7 +181,19 @@ if __name__ == '__main__':
     assert quantile(quantile_list, 0.25) == 3
     assert quantile(quantile_list, 0.75) == 8
     assert quantile(quantile_list, 0.90) == 10
+    assert quantiles(quantile_list, [0.10, 0.25, 0.75, 0.90]) == [2, 3, 8, 10]
+
+    assert sorted_stats([1, 10, 2, 9, 5])['median'] == 5
+    assert sorted_stats([1, 9, 2, 10])['median'] == (2 + 9) / 2
+    assert sorted_stats([1, 9, 2, 10])['sorted'].tolist() == [1, 2, 9, 10]
     print('hello!')
     mode_list = [1, 2, 3, 4, 4, 5, 6, 7, 8, 8, 9, 10]
 
     assert set(mode(mode_list)) == {4, 8}
+    assert set(mode([0.5, 1.5, 1.5, 2.5, 0.5])) == {0.5, 1.5}
+    assert set(mode([-1, 1000, 1000, -1, 3])) == {-1, 1000}
+    assert mode([(1, 2), (1, 2), (3, 4)]) == [(1, 2)]
+    assert mode([(1,), (1, 2), (1,)]) == [(1,)]
+    assert mode([8, 4, 4, 8, 1]) == [8, 4]
+    assert mode([1, 2.5, 2.5]) == [2.5]
+    assert mode([True, True, 0]) == [True]